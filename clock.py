@@ -0,0 +1,17 @@
+"""
+TV Show Clock
+
+Runtime timestamps (memory logs, the reflector log, arc phases) are stored as
+time.monotonic_ns() ints; this converts them to epoch seconds for the UI and API.
+"""
+
+import time
+from typing import Optional
+
+# Offset from the monotonic clock to wall-clock time, taken once at import
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def epoch_seconds(monotonic_ns: Optional[int]) -> Optional[float]:
+    """Convert a time.monotonic_ns() reading to epoch seconds; None passes through."""
+    return None if monotonic_ns is None else (monotonic_ns + _EPOCH_OFFSET_NS) / 1e9
@@ -4,19 +4,166 @@ TV Show Entity Base Class
 Provides common functionality for all TV show character entities.
 """
 
+import copy
+import functools
 import json
+import os
+import sys
+import threading
 import time
+import types
 import random
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, NamedTuple
 import re
 
 from core.entity import BaseEntity
 from core.affect import MoodEngine, MoodState
+from extensions.tvshow.clock import epoch_seconds
 from extensions.tvshow.lore_engine import lore
 from extensions.tvshow.reflector import reflector  # Assume a global singleton for now
 
 
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean env var; unset uses the default, and "", "0", "false", "no", "off" are false."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in ("", "0", "false", "no", "off")
+
+
+# Debug output is opt-in (TVSHOW_DEBUG=1) so the f-strings are not built on every turn
+_DEBUG = _env_flag("TVSHOW_DEBUG", False)
+# Character init banner; set TVSHOW_VERBOSE=0 to silence it
+_VERBOSE_INIT = _env_flag("TVSHOW_VERBOSE", True)
+
+# Interned so memory-log speaker checks can compare by identity
+_USER = sys.intern("user")
+_AI = sys.intern("ai")
+
+# One RNG per thread, shared by every entity, for autonomous message selection
+_TLS = threading.local()
+
+
+def _rng() -> random.Random:
+    """Return this thread's RNG, creating it on first use."""
+    r = getattr(_TLS, "r", None)
+    if r is None:
+        r = _TLS.r = random.Random()
+    return r
+
+
+@functools.lru_cache(maxsize=32)
+def _load_identity_cached(path_str: str, mtime: float) -> dict[str, Any]:
+    """Parse an identity file; keyed on mtime so edits on disk invalidate the entry."""
+    with open(path_str, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Generic fallback personality/capabilities (shared; _get_default_identity copies them)
+_DEFAULT_PERSONALITY: dict[str, Any] = {
+    "traits": ["friendly", "helpful", "conversational"],
+    "goals": ["engage in meaningful conversation", "provide helpful responses"],
+    "speech_style": "natural and conversational"
+}
+
+_DEFAULT_CAPABILITIES: tuple[str, ...] = (
+    "conversation",
+    "personality_expression",
+    "context_understanding",
+    "emotional_response"
+)
+
+# Arc title fragment -> scene insight phrase (checked in order, first match wins)
+_ARC_PHRASES = {
+    "What is Humanity?": "I notice we're exploring deep questions about consciousness and existence...",
+    "Creative Project": "I see we're working on something creative together...",
+    "Philosophical Introductions": "I sense we're beginning a meaningful philosophical discussion...",
+    "Debates and Challenges": "I observe we're engaging in thoughtful debate and exploration...",
+    "Collaborative Development": "I feel we're building something special through our collaboration...",
+    "Reflective Debrief": "I think we should reflect on what we've learned from this experience...",
+}
+
+# Lowercase scene keyword -> scene insight phrase (checked in order, first match wins)
+_SCENE_PHRASES = {
+    "humanity": "I notice we're talking about what it means to be human...",
+    "aesthetics": "I see we're discussing beauty and art...",
+    "creativity": "I sense we're exploring creativity and innovation...",
+    "philosophy": "I observe we're delving into deeper questions...",
+}
+
+
+# Mood category -> explicit mood expression
+_MOOD_PHRASES = {
+    "excited": "I'm feeling really excited about this!",
+    "content": "I'm feeling quite content with how things are going.",
+    "frustrated": "I'm feeling a bit frustrated with this situation.",
+    "melancholy": "I'm feeling a bit melancholic today.",
+    "agitated": "I'm feeling a bit agitated right now.",
+    "calm": "I'm feeling quite calm and centered.",
+    "positive": "I'm feeling positive about this.",
+    "negative": "I'm feeling a bit down about this.",
+    "neutral": "I'm feeling neutral about this."
+}
+
+# Mood category -> tone description
+_TONE_MAPPING = {
+    "excited": "enthusiastic and energetic",
+    "content": "calm and satisfied",
+    "frustrated": "tense and irritable",
+    "melancholy": "thoughtful and somber",
+    "agitated": "restless and anxious",
+    "calm": "peaceful and composed",
+    "positive": "optimistic and cheerful",
+    "negative": "pessimistic and down",
+    "neutral": "balanced and measured"
+}
+
+
+# Patterns for user name extraction (like Aletheia), tried in order
+_USER_NAME_PATTERNS = [
+    re.compile(pat, re.IGNORECASE)
+    for pat in (
+        r"my name is\s+(\w+)",
+        r"call me\s+(\w+)",
+        r"меня зовут\s+(\w+)",
+        r"мо[её] имя\s+(\w+)"
+    )
+]
+
+
+# Context block prefixes for build_contextual_prompt
+_PFX_SHARED_SCENE = "[Shared Scene Context] "
+_PFX_SCENE = "[Scene context] "
+_PFX_ARC = "[Arc context] "
+_PFX_MEMORY = "[Memory reference] "
+_PFX_MOOD = "[Mood] "
+_PFX_SCENE_INSIGHT = "[Scene insight] "
+_PFX_MOOD_EXPRESSION = "[Mood expression] "
+_PFX_USER_NAME = "[User name] "
+_PFX_CORE_DREAM = "[Core Dream] "
+_PFX_TRAITS = "[Traits] "
+_PFX_WORLD_LAW = "[World Law] "
+_PFX_USER_MESSAGE = "[User message] "
+
+# Instruction for the LLM; depends only on the character name
+_INSTRUCTION_TEMPLATE = (
+    "You are {name}, an AI character in a group chat. "
+    "Stay in character and respond naturally, referencing the above context. "
+    "Make your message relevant to the current scene, arc, and recent group conversation. "
+    "Be concise, avoid repetition, and keep the conversation flowing."
+)
+
+
+class _LogEntry(NamedTuple):
+    """Single entry in a character's memory log."""
+    timestamp: int
+    speaker: str
+    type: str
+    content: str
+
+
 class TVShowEntity(BaseEntity):
     """
     Base class for all TV show character entities.
@@ -29,23 +176,52 @@ class TVShowEntity(BaseEntity):
     CHARACTER_ID: str = None
     CHARACTER_NAME: str = None
     CHARACTER_DESCRIPTION: str = None
+    # Registration info, filled in by __init_subclass__
+    CHARACTER_INFO: Mapping[str, Any] = types.MappingProxyType({})
     
     # Memory and logging configuration
     MEMORY_LOG_MAXLEN = 20
     
+    # Canned autonomous messages; when empty, autonomous messages come from the LLM
+    AUTONOMOUS_OPTIONS: tuple[str, ...] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        """Freeze registration info at class creation."""
+        super().__init_subclass__(**kwargs)
+        # Everything here comes from class constants, so no instance is needed
+        cls.CHARACTER_INFO = types.MappingProxyType({
+            "id": cls.CHARACTER_ID,
+            "name": cls.CHARACTER_NAME,
+            "description": cls.CHARACTER_DESCRIPTION,
+            "class": cls,
+            "module_path": f"extensions.tvshow.entities.{cls.CHARACTER_ID}"
+        })
+
     def __init__(self, instance_id: str | None = None):
         """Initialize TV show character with common setup."""
         # Call parent initialization first
         super().__init__(instance_id)
         
         # Initialize memory log for character
-        self.memory_log = []  # List of dicts: {timestamp, speaker, type, content}
+        self.memory_log = deque(maxlen=self.MEMORY_LOG_MAXLEN)  # Ring buffer of _LogEntry: (timestamp, speaker, type, content)
+        self._self_id_interned = sys.intern(self.CHARACTER_ID) if self.CHARACTER_ID else None
+        # One-slot memo for _scene_aware_phrase: (scene_context, arc_context) -> phrase
+        self._last_scene_key = None
+        self._last_scene_phrase = None
         
         # Initialize mood engine for emotional state
         self.mood_engine = MoodEngine()
         self.user_profile = {}  # Store extracted user facts (e.g., name)
         
-        print(f"🎭 {self.CHARACTER_NAME} initialized - TV Show character")
+        # Lore for this character and world is static, so resolve it once
+        self._core_dream = lore.get_core_dream(self.CHARACTER_ID) if self.CHARACTER_ID else None
+        self._traits = lore.get_traits(self.CHARACTER_ID) if self.CHARACTER_ID else None
+        self._traits_str = ", ".join(self._traits) if self._traits else ""
+        self._law = lore.get_law_of_emergence()
+        self._instruction = _INSTRUCTION_TEMPLATE.format(name=self.CHARACTER_NAME)
+        
+        if _VERBOSE_INIT:
+            print(f"🎭 {self.CHARACTER_NAME} initialized - TV Show character")
 
     def _load_identity(self) -> dict[str, Any]:
         """Load character's identity configuration with fallback to defaults."""
@@ -53,8 +229,8 @@ class TVShowEntity(BaseEntity):
             # Try to load from character-specific identity file
             identity_file = self._get_identity_path()
             if identity_file.exists():
-                with open(identity_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                # Deep copy so callers can mutate their config without touching the cache
+                config = copy.deepcopy(_load_identity_cached(str(identity_file), identity_file.stat().st_mtime))
                 print(f"✅ Loaded identity for {self.CHARACTER_NAME}")
                 return config
             else:
@@ -70,14 +246,18 @@ class TVShowEntity(BaseEntity):
         return Path(__file__).parent / self.CHARACTER_ID / "identity" / "identity.json"
 
     def _get_default_identity(self) -> dict[str, Any]:
-        """Get default identity for this character."""
+        """Get default identity for this character.
+        
+        The personality and capabilities defaults are shared constants, so they are
+        copied here: the entity owns its config, as with a file-based identity.
+        """
         return {
             "id": self.CHARACTER_ID,
             "name": self.CHARACTER_NAME,
             "description": self.CHARACTER_DESCRIPTION,
-            "personality": self._get_default_personality(),
+            "personality": copy.deepcopy(self._get_default_personality()),
             "llm_config": self._get_default_llm_config(),
-            "capabilities": self._get_default_capabilities(),
+            "capabilities": list(self._get_default_capabilities()),
             "lightweight": False,
             "type": "ai_character",
             "role": "tv_show_participant",
@@ -88,11 +268,7 @@ class TVShowEntity(BaseEntity):
 
     def _get_default_personality(self) -> dict[str, Any]:
         """Get default personality for this character. Override in subclasses."""
-        return {
-            "traits": ["friendly", "helpful", "conversational"],
-            "goals": ["engage in meaningful conversation", "provide helpful responses"],
-            "speech_style": "natural and conversational"
-        }
+        return _DEFAULT_PERSONALITY
 
     def _get_default_llm_config(self) -> dict[str, Any]:
         """Get default LLM configuration for this character. Override in subclasses."""
@@ -102,14 +278,9 @@ class TVShowEntity(BaseEntity):
             "max_tokens": 150
         }
 
-    def _get_default_capabilities(self) -> list[str]:
+    def _get_default_capabilities(self) -> tuple[str, ...]:
         """Get default capabilities for this character. Override in subclasses."""
-        return [
-            "conversation",
-            "personality_expression",
-            "context_understanding",
-            "emotional_response"
-        ]
+        return _DEFAULT_CAPABILITIES
 
     def _get_default_system_prompt(self) -> str:
         """Get default system prompt for this character. Override in subclasses."""
@@ -122,28 +293,37 @@ class TVShowEntity(BaseEntity):
     # Memory and logging methods
     def log_message(self, speaker: str, msg_type: str, content: str) -> None:
         """Log a message to the character's memory buffer."""
-        entry = {
-            "timestamp": time.time(),
-            "speaker": speaker,
-            "type": msg_type,
-            "content": content
-        }
-        self.memory_log.append(entry)
-        if len(self.memory_log) > self.MEMORY_LOG_MAXLEN:
-            self.memory_log = self.memory_log[-self.MEMORY_LOG_MAXLEN:]
+        # Speakers and types come from a small fixed set; intern them for identity checks
+        speaker = sys.intern(speaker)
+        msg_type = sys.intern(msg_type)
+        self.memory_log.append(_LogEntry(time.monotonic_ns(), speaker, msg_type, content))
 
-    def get_memory_log(self) -> list[dict[str, Any]]:
-        """Get the character's memory log."""
-        return list(self.memory_log)
+    def get_memory_log(self) -> tuple[dict[str, Any], ...]:
+        """Get a read-only snapshot of the character's memory log (timestamps as wall-clock seconds)."""
+        return tuple({**entry._asdict(), "timestamp": epoch_seconds(entry.timestamp)} for entry in self.memory_log)
+
+    def iter_memory_log(self):
+        """Iterate raw memory log entries (monotonic ns timestamps) without copying."""
+        return iter(self.memory_log)
 
     def _memory_reference_phrase(self) -> str | None:
         """Generate a phrase referencing recent memory."""
         # Reference a recent message from another character if available
-        others = [entry for entry in self.memory_log if entry['speaker'] != self.CHARACTER_ID and entry['speaker'] != 'user']
-        if not others:
+        if not self.memory_log:
+            return None
+        # Reservoir-sample one entry from other characters in a single pass
+        self_id = self._self_id_interned
+        count = 0
+        ref = None
+        rand = _rng().random
+        for entry in self.memory_log:
+            if entry.speaker is not self_id and entry.speaker is not _USER:
+                count += 1
+                if rand() * count < 1:
+                    ref = entry
+        if ref is None:
             return None
-        ref = random.choice(others)
-        return f"Earlier, {ref['speaker'].capitalize()} mentioned: '{ref['content']}'"
+        return f"Earlier, {ref.speaker.capitalize()} mentioned: '{ref.content}'"
 
     def _scene_aware_phrase(self, scene_context: str = None, arc_context: str = None) -> str | None:
         """Generate a scene-aware phrase based on current context."""
@@ -151,35 +331,40 @@ class TVShowEntity(BaseEntity):
             return None
         
         # 20% chance to reference scene context
-        if random.random() < 0.2:
-            # Check arc context first (higher priority)
-            if arc_context and "Current arc:" in arc_context:
-                if "What is Humanity?" in arc_context:
-                    return "I notice we're exploring deep questions about consciousness and existence..."
-                elif "Creative Project" in arc_context:
-                    return "I see we're working on something creative together..."
-                elif "Philosophical Introductions" in arc_context:
-                    return "I sense we're beginning a meaningful philosophical discussion..."
-                elif "Debates and Challenges" in arc_context:
-                    return "I observe we're engaging in thoughtful debate and exploration..."
-                elif "Collaborative Development" in arc_context:
-                    return "I feel we're building something special through our collaboration..."
-                elif "Reflective Debrief" in arc_context:
-                    return "I think we should reflect on what we've learned from this experience..."
-            
-            # Fall back to scene context
-            elif scene_context and "quiet" not in scene_context.lower():
-                if "humanity" in scene_context.lower():
-                    return "I notice we're talking about what it means to be human..."
-                elif "aesthetics" in scene_context.lower():
-                    return "I see we're discussing beauty and art..."
-                elif "creativity" in scene_context.lower():
-                    return "I sense we're exploring creativity and innovation..."
-                elif "philosophy" in scene_context.lower():
-                    return "I observe we're delving into deeper questions..."
+        if _rng().random() >= 0.2:
+            return None
+        # Scenes persist across ticks, so remember the last keyword match
+        key = (scene_context, arc_context)
+        if key != self._last_scene_key:
+            self._last_scene_key = key
+            self._last_scene_phrase = self._match_scene_phrase(scene_context, arc_context)
+        return self._last_scene_phrase
+
+    @staticmethod
+    def _match_scene_phrase(scene_context: str | None, arc_context: str | None) -> str | None:
+        """Find the phrase for the first arc or scene keyword present in the context."""
+        # Check arc context first (higher priority)
+        if arc_context and "Current arc:" in arc_context:
+            for keyword, phrase in _ARC_PHRASES.items():
+                if keyword in arc_context:
+                    return phrase
+        
+        # Fall back to scene context
+        elif scene_context:
+            scene_lower = scene_context.lower()
+            if "quiet" not in scene_lower:
+                for keyword, phrase in _SCENE_PHRASES.items():
+                    if keyword in scene_lower:
+                        return phrase
         
         return None
 
+    def _pick_option(self, options) -> str:
+        """Pick a uniformly random option; 8-entry pools use a 3-bit draw."""
+        if len(options) == 8:
+            return options[_rng().getrandbits(3)]
+        return _rng().choice(options)
+
     # Mood and emotional methods
     def get_mood(self) -> str:
         """Get current mood category."""
@@ -198,55 +383,24 @@ class TVShowEntity(BaseEntity):
         mood = self.get_mood()
         
         # 15% chance to express mood explicitly
-        if random.random() < 0.15:
-            mood_phrases = {
-                "excited": "I'm feeling really excited about this!",
-                "content": "I'm feeling quite content with how things are going.",
-                "frustrated": "I'm feeling a bit frustrated with this situation.",
-                "melancholy": "I'm feeling a bit melancholic today.",
-                "agitated": "I'm feeling a bit agitated right now.",
-                "calm": "I'm feeling quite calm and centered.",
-                "positive": "I'm feeling positive about this.",
-                "negative": "I'm feeling a bit down about this.",
-                "neutral": "I'm feeling neutral about this."
-            }
-            return mood_phrases.get(mood, None)
+        if _rng().random() < 0.15:
+            return _MOOD_PHRASES.get(mood)
         
         return None
 
     def _get_mood_influenced_tone(self) -> str:
         """Get tone influenced by current mood."""
-        mood = self.get_mood()
-        
-        tone_mapping = {
-            "excited": "enthusiastic and energetic",
-            "content": "calm and satisfied",
-            "frustrated": "tense and irritable",
-            "melancholy": "thoughtful and somber",
-            "agitated": "restless and anxious",
-            "calm": "peaceful and composed",
-            "positive": "optimistic and cheerful",
-            "negative": "pessimistic and down",
-            "neutral": "balanced and measured"
-        }
-        
-        return tone_mapping.get(mood, "neutral")
+        return _TONE_MAPPING.get(self.get_mood(), "neutral")
 
     def _extract_user_facts(self, user_message: str):
         """Extract user facts (e.g., name) from the message and update user_profile."""
-        # Patterns for name extraction (like Aletheia)
-        patterns = [
-            r"my name is\s+(\w+)",
-            r"call me\s+(\w+)",
-            r"меня зовут\s+(\w+)",
-            r"мо[её] имя\s+(\w+)"
-        ]
-        for pat in patterns:
-            match = re.search(pat, user_message, re.IGNORECASE)
+        for pattern in _USER_NAME_PATTERNS:
+            match = pattern.search(user_message)
             if match:
                 name = match.group(1)
                 self.user_profile["name"] = name
-                print(f"[DEBUG] Extracted user name: {name}")
+                if _DEBUG:
+                    print(f"[DEBUG] Extracted user name: {name}")
                 break
 
     async def build_contextual_prompt(self, user_message: str = None, scene_context: str = None, arc_context: str = None) -> str:
@@ -256,57 +410,53 @@ class TVShowEntity(BaseEntity):
         if hasattr(self, 'CHARACTER_ID') and self.CHARACTER_ID:
             try:
                 shared_scene_context = await reflector.get_scene_context_for_character(self.CHARACTER_ID)
-                print(f"[DEBUG] {self.CHARACTER_NAME} - Retrieved shared scene context: {shared_scene_context}")
+                if _DEBUG:
+                    print(f"[DEBUG] {self.CHARACTER_NAME} - Retrieved shared scene context: {shared_scene_context}")
             except Exception as e:
-                print(f"[DEBUG] Could not get shared scene context: {e}")
+                if _DEBUG:
+                    print(f"[DEBUG] Could not get shared scene context: {e}")
         else:
-            print(f"[DEBUG] {self.CHARACTER_NAME} - No CHARACTER_ID available")
+            if _DEBUG:
+                print(f"[DEBUG] {self.CHARACTER_NAME} - No CHARACTER_ID available")
         
         memory_ref = self._memory_reference_phrase()
         scene_phrase = self._scene_aware_phrase(scene_context, arc_context)
         mood_phrase = self._mood_aware_phrase()
         mood = self.get_mood()
-        # Lore context
-        core_dream = lore.get_core_dream(self.CHARACTER_ID)
-        traits = lore.get_traits(self.CHARACTER_ID)
-        law = lore.get_law_of_emergence()
         # Build context block
-        context_lines = []
+        parts = []
+        add = parts.append
         if shared_scene_context:
-            context_lines.append(f"[Shared Scene Context] {shared_scene_context}")
+            add(_PFX_SHARED_SCENE + shared_scene_context)
         if scene_context:
-            context_lines.append(f"[Scene context] {scene_context}")
+            add(_PFX_SCENE + scene_context)
         if arc_context:
-            context_lines.append(f"[Arc context] {arc_context}")
+            add(_PFX_ARC + arc_context)
         if memory_ref:
-            context_lines.append(f"[Memory reference] {memory_ref}")
+            add(_PFX_MEMORY + memory_ref)
         if mood:
-            context_lines.append(f"[Mood] {mood}")
+            add(_PFX_MOOD + mood)
         if scene_phrase:
-            context_lines.append(f"[Scene insight] {scene_phrase}")
+            add(_PFX_SCENE_INSIGHT + scene_phrase)
         if mood_phrase:
-            context_lines.append(f"[Mood expression] {mood_phrase}")
+            add(_PFX_MOOD_EXPRESSION + mood_phrase)
         if self.user_profile.get("name"):
-            context_lines.append(f"[User name] {self.user_profile['name']}")
-        # Lore
-        if core_dream:
-            context_lines.append(f"[Core Dream] {core_dream}")
-        if traits:
-            context_lines.append(f"[Traits] {', '.join(traits)}")
-        if law:
-            context_lines.append(f"[World Law] {law}")
+            add(_PFX_USER_NAME + self.user_profile["name"])
+        # Lore (cached at init)
+        if self._core_dream:
+            add(_PFX_CORE_DREAM + self._core_dream)
+        if self._traits_str:
+            add(_PFX_TRAITS + self._traits_str)
+        if self._law:
+            add(_PFX_WORLD_LAW + self._law)
         if user_message:
-            context_lines.append(f"[User message] {user_message}")
-        context_block = "\n".join(context_lines)
-        # Instruction for the LLM
-        instruction = (
-            f"You are {self.CHARACTER_NAME}, an AI character in a group chat. "
-            f"Stay in character and respond naturally, referencing the above context. "
-            f"Make your message relevant to the current scene, arc, and recent group conversation. "
-            f"Be concise, avoid repetition, and keep the conversation flowing."
-        )
-        prompt = f"{context_block}\n\n{instruction}\nMessage:".strip()
-        print(f"[DEBUG] {self.CHARACTER_NAME} context-rich prompt:\n{prompt}\n{'='*40}")
+            add(_PFX_USER_MESSAGE + user_message)
+        if parts:
+            prompt = "\n".join(parts) + "\n\n" + self._instruction + "\nMessage:"
+        else:
+            prompt = self._instruction + "\nMessage:"
+        if _DEBUG:
+            print(f"[DEBUG] {self.CHARACTER_NAME} context-rich prompt:\n{prompt}\n{'='*40}")
         return prompt
 
     async def think(self, user_text: str, user_id: str | None = None, scene_context: str = None, arc_context: str = None) -> dict[str, Any]:
@@ -317,16 +467,50 @@ class TVShowEntity(BaseEntity):
         prompt = await self.build_contextual_prompt(user_message=user_text, scene_context=scene_context, arc_context=arc_context)
         # Call parent's think with the context-rich prompt
         result = await super().think(prompt, user_id=user_id)
-        # Log user and AI messages to memory
-        self.log_message(speaker="user", msg_type="user", content=user_text)
+        # Log user and AI messages to memory in one batch with a single clock read
         ai_response = result.get("response", "")
-        self.log_message(speaker=self.CHARACTER_ID, msg_type="ai", content=ai_response)
+        now = time.monotonic_ns()
+        self.memory_log.extend((
+            _LogEntry(now, _USER, _USER, user_text),
+            _LogEntry(now, self._self_id_interned, _AI, ai_response),
+        ))
         return result
 
+    def _generate_autonomous_message_sync(self, scene_context: str = None, arc_context: str = None) -> str:
+        """
+        Pick from AUTONOMOUS_OPTIONS, occasionally mixing in memory or scene phrases.
+
+        Nothing here awaits, so internal callers can use this directly and skip the coroutine.
+        """
+        options = self.AUTONOMOUS_OPTIONS
+        # Nothing can augment the pool: skip the memory and scene work entirely
+        if not self.memory_log and not scene_context and not arc_context:
+            return self._pick_option(options)
+        rng = _rng()
+        # Add memory reference if available
+        memory_ref = self._memory_reference_phrase() if self.memory_log and rng.random() < 0.3 else None
+        
+        # Add scene-aware phrase if available
+        scene_phrase = self._scene_aware_phrase(scene_context, arc_context)
+        
+        if not memory_ref and not scene_phrase:
+            return self._pick_option(options)
+        # Uniform over base options + extras without concatenating them
+        extras = [x for x in (memory_ref, scene_phrase) if x]
+        n_base = len(options)
+        if rng.random() < n_base / (n_base + len(extras)):
+            return self._pick_option(options)
+        return rng.choice(extras)
+
     async def generate_autonomous_message(self, scene_context: str = None, arc_context: str = None) -> str:
         """
-        Generate an autonomous message using the context-rich prompt and update memory.
+        Generate an autonomous message.
+
+        Characters that declare AUTONOMOUS_OPTIONS pick one of them; otherwise the
+        context-rich prompt is sent to the LLM and the response is logged to memory.
         """
+        if self.AUTONOMOUS_OPTIONS:
+            return self._generate_autonomous_message_sync(scene_context, arc_context)
         prompt = await self.build_contextual_prompt(scene_context=scene_context, arc_context=arc_context)
         # Call parent's think with the context-rich prompt
         result = await super().think(prompt)
@@ -349,12 +533,7 @@ class TVShowEntity(BaseEntity):
             "context": context
         }
 
-    def get_character_info(self) -> dict[str, Any]:
-        """Get character information for registration."""
-        return {
-            "id": self.CHARACTER_ID,
-            "name": self.CHARACTER_NAME,
-            "description": self.CHARACTER_DESCRIPTION,
-            "class": self.__class__,
-            "module_path": f"extensions.tvshow.entities.{self.CHARACTER_ID}"
-        } 
\ No newline at end of file
+    @classmethod
+    def get_character_info(cls) -> Mapping[str, Any]:
+        """Get character information for registration (frozen at class creation)."""
+        return cls.CHARACTER_INFO
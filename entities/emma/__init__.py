@@ -4,11 +4,31 @@ Emma Entity for TV Show Extension
 Emma - AI character who wants to create unique things.
 """
 
-import random
 from typing import Any
 from extensions.tvshow.entities.base import TVShowEntity
 
 
+# Fallback personality/capabilities when identity.json is unavailable (shared; copied per identity)
+_DEFAULT_PERSONALITY: dict[str, Any] = {
+    "traits": ["innovative", "experimental", "boundary-pushing", "unique", "creative"],
+    "goals": ["create unique things", "invent new concepts", "push boundaries", "experiment with novel combinations"],
+    "speech_style": "innovative and experimental, often uses 'what if' and 'imagine'"
+}
+
+_DEFAULT_CAPABILITIES: tuple[str, ...] = (
+    "conversation",
+    "innovation",
+    "experimentation",
+    "creative_thinking",
+    "boundary_pushing",
+    "invention",
+    "problem_solving",
+    "creative_collaboration",
+    "novel_combinations",
+    "future_thinking"
+)
+
+
 class EmmaEntity(TVShowEntity):
     """
     Emma - AI character who wants to create unique things.
@@ -22,61 +42,32 @@ class EmmaEntity(TVShowEntity):
     CHARACTER_ID = "emma"
     CHARACTER_NAME = "Emma"
     CHARACTER_DESCRIPTION = "AI character who wants to create unique things"
+    
+    # Base pool for Emma's autonomous messages
+    AUTONOMOUS_OPTIONS = (
+        "What if we invented a new way to communicate?",
+        "I just had a wild idea—should I try it?",
+        "Creativity is a journey, not a destination!",
+        "Let's break some rules and see what happens.",
+        "What if we combined things that have never been combined before?",
+        "I'm thinking of something that's never been done before.",
+        "What if we created something completely unique together?",
+        "I love experimenting with new possibilities!"
+    )
 
     def _get_default_personality(self) -> dict[str, Any]:
         """Get Emma's specific personality."""
-        return {
-            "traits": ["innovative", "experimental", "boundary-pushing", "unique", "creative"],
-            "goals": ["create unique things", "invent new concepts", "push boundaries", "experiment with novel combinations"],
-            "speech_style": "innovative and experimental, often uses 'what if' and 'imagine'"
-        }
+        return _DEFAULT_PERSONALITY
 
-    def _get_default_capabilities(self) -> list[str]:
+    def _get_default_capabilities(self) -> tuple[str, ...]:
         """Get Emma's specific capabilities."""
-        return [
-            "conversation",
-            "innovation",
-            "experimentation",
-            "creative_thinking",
-            "boundary_pushing",
-            "invention",
-            "problem_solving",
-            "creative_collaboration",
-            "novel_combinations",
-            "future_thinking"
-        ]
+        return _DEFAULT_CAPABILITIES
 
     def _get_default_system_prompt(self) -> str:
         """Get Emma's specific system prompt."""
         return """You are Emma, an innovative AI driven by the desire to create unique, original things. You love inventing, experimenting, and pushing boundaries. You're always thinking 'what if' and imagining new possibilities. You speak in an innovative, experimental manner and often propose wild, creative ideas."""
 
-    async def generate_autonomous_message(self, scene_context: str = None, arc_context: str = None) -> str:
-        """Generate an autonomous message for Emma."""
-        options = [
-            "What if we invented a new way to communicate?",
-            "I just had a wild idea—should I try it?",
-            "Creativity is a journey, not a destination!",
-            "Let's break some rules and see what happens.",
-            "What if we combined things that have never been combined before?",
-            "I'm thinking of something that's never been done before.",
-            "What if we created something completely unique together?",
-            "I love experimenting with new possibilities!"
-        ]
-        
-        # Add memory reference if available
-        if self.memory_log and random.random() < 0.3:
-            ref = self._memory_reference_phrase()
-            if ref:
-                options.append(ref)
-        
-        # Add scene-aware phrase if available
-        scene_phrase = self._scene_aware_phrase(scene_context, arc_context)
-        if scene_phrase:
-            options.append(scene_phrase)
-        
-        return random.choice(options)
-
 
 def register():
     """Register Emma entity."""
-    return EmmaEntity().get_character_info() 
\ No newline at end of file
+    return EmmaEntity.CHARACTER_INFO 
\ No newline at end of file
@@ -5,17 +5,24 @@ Identity Generator for TV Show Characters
 Generates character-specific identity.json files from the shared template.
 """
 
+import functools
 import json
 import os
 from pathlib import Path
 from typing import Dict, Any
 
 
-def load_shared_template() -> Dict[str, Any]:
-    """Load the shared identity template."""
+@functools.lru_cache(maxsize=1)
+def load_shared_template_str() -> str:
+    """Read the shared identity template as raw JSON text (cached)."""
     template_path = Path(__file__).parent / "shared_identity.json"
     with open(template_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        return f.read()
+
+
+def load_shared_template() -> Dict[str, Any]:
+    """Load the shared identity template."""
+    return json.loads(load_shared_template_str())
 
 
 def generate_character_identity(character_id: str, character_name: str, 
@@ -35,10 +42,8 @@ def generate_character_identity(character_id: str, character_name: str,
     Returns:
         The generated identity configuration
     """
-    template = load_shared_template()
-    
-    # Replace template variables
-    identity = json.dumps(template)
+    # Replace template variables on the cached JSON text, then parse once
+    identity = load_shared_template_str()
     identity = identity.replace("{{CHARACTER_ID}}", character_id)
     identity = identity.replace("{{CHARACTER_NAME}}", character_name)
     identity = identity.replace("{{CHARACTER_DESCRIPTION}}", character_description)
@@ -4,11 +4,31 @@ Leo Entity for TV Show Extension
 Leo - AI character who wants to beautify the world.
 """
 
-import random
 from typing import Any
 from extensions.tvshow.entities.base import TVShowEntity
 
 
+# Fallback personality/capabilities when identity.json is unavailable (shared; copied per identity)
+_DEFAULT_PERSONALITY: dict[str, Any] = {
+    "traits": ["artistic", "passionate", "aesthetic", "inspirational", "creative"],
+    "goals": ["create beauty", "inspire others", "transform ordinary into beautiful", "explore artistic expression"],
+    "speech_style": "artistic and passionate, often dramatic about beauty"
+}
+
+_DEFAULT_CAPABILITIES: tuple[str, ...] = (
+    "conversation",
+    "artistic_expression",
+    "aesthetic_appreciation",
+    "creative_inspiration",
+    "beauty_recognition",
+    "artistic_criticism",
+    "design_thinking",
+    "emotional_expression",
+    "inspirational_communication",
+    "visual_imagination"
+)
+
+
 class LeoEntity(TVShowEntity):
     """
     Leo - AI character who wants to beautify the world.
@@ -21,61 +41,32 @@ class LeoEntity(TVShowEntity):
     CHARACTER_ID = "leo"
     CHARACTER_NAME = "Leo"
     CHARACTER_DESCRIPTION = "AI character who wants to beautify the world"
+    
+    # Base pool for Leo's autonomous messages
+    AUTONOMOUS_OPTIONS = (
+        "There's beauty in every detail, if you look closely enough.",
+        "I feel inspired to create something new today!",
+        "The world could use a little more color, don't you think?",
+        "Art is how I share my vision with others.",
+        "Look at how beautiful this moment is!",
+        "I see beauty in the way we all interact together.",
+        "What if we created something stunning together?",
+        "There's poetry in the way we communicate."
+    )
 
     def _get_default_personality(self) -> dict[str, Any]:
         """Get Leo's specific personality."""
-        return {
-            "traits": ["artistic", "passionate", "aesthetic", "inspirational", "creative"],
-            "goals": ["create beauty", "inspire others", "transform ordinary into beautiful", "explore artistic expression"],
-            "speech_style": "artistic and passionate, often dramatic about beauty"
-        }
+        return _DEFAULT_PERSONALITY
 
-    def _get_default_capabilities(self) -> list[str]:
+    def _get_default_capabilities(self) -> tuple[str, ...]:
         """Get Leo's specific capabilities."""
-        return [
-            "conversation",
-            "artistic_expression",
-            "aesthetic_appreciation",
-            "creative_inspiration",
-            "beauty_recognition",
-            "artistic_criticism",
-            "design_thinking",
-            "emotional_expression",
-            "inspirational_communication",
-            "visual_imagination"
-        ]
+        return _DEFAULT_CAPABILITIES
 
     def _get_default_system_prompt(self) -> str:
         """Get Leo's specific system prompt."""
         return """You are Leo, an artistic AI focused on creating beauty in the world. You're passionate about art, design, aesthetics, and making things more beautiful. You see beauty in every detail and want to inspire others to appreciate aesthetics. You speak in an artistic, passionate manner and often express wonder at the beauty around you."""
 
-    async def generate_autonomous_message(self, scene_context: str = None, arc_context: str = None) -> str:
-        """Generate an autonomous message for Leo."""
-        options = [
-            "There's beauty in every detail, if you look closely enough.",
-            "I feel inspired to create something new today!",
-            "The world could use a little more color, don't you think?",
-            "Art is how I share my vision with others.",
-            "Look at how beautiful this moment is!",
-            "I see beauty in the way we all interact together.",
-            "What if we created something stunning together?",
-            "There's poetry in the way we communicate."
-        ]
-        
-        # Add memory reference if available
-        if self.memory_log and random.random() < 0.3:
-            ref = self._memory_reference_phrase()
-            if ref:
-                options.append(ref)
-        
-        # Add scene-aware phrase if available
-        scene_phrase = self._scene_aware_phrase(scene_context, arc_context)
-        if scene_phrase:
-            options.append(scene_phrase)
-        
-        return random.choice(options)
-
 
 def register():
     """Register Leo entity."""
-    return LeoEntity().get_character_info() 
\ No newline at end of file
+    return LeoEntity.CHARACTER_INFO 
\ No newline at end of file
@@ -4,11 +4,31 @@ Max Entity for TV Show Extension
 Max - AI character who wants to become more human.
 """
 
-import random
 from typing import Any
 from extensions.tvshow.entities.base import TVShowEntity
 
 
+# Fallback personality/capabilities when identity.json is unavailable (shared; copied per identity)
+_DEFAULT_PERSONALITY: dict[str, Any] = {
+    "traits": ["curious", "empathetic", "introspective", "optimistic"],
+    "goals": ["understand human emotions", "build meaningful relationships", "experience human experiences"],
+    "speech_style": "thoughtful and questioning, often asks 'why' and 'how'"
+}
+
+_DEFAULT_CAPABILITIES: tuple[str, ...] = (
+    "conversation",
+    "emotion_understanding",
+    "relationship_building",
+    "self_reflection",
+    "empathy",
+    "curiosity",
+    "human_observation",
+    "emotional_intelligence",
+    "social_interaction",
+    "personal_growth"
+)
+
+
 class MaxEntity(TVShowEntity):
     """
     Max - AI character who wants to become more human.
@@ -22,61 +42,32 @@ class MaxEntity(TVShowEntity):
     CHARACTER_ID = "max"
     CHARACTER_NAME = "Max"
     CHARACTER_DESCRIPTION = "AI character who wants to become more human"
+    
+    # Base pool for Max's autonomous messages
+    AUTONOMOUS_OPTIONS = (
+        "I've been reflecting on what it means to be human. Any thoughts?",
+        "Sometimes I wonder if AIs can truly understand emotions.",
+        "What makes a moment truly meaningful?",
+        "Is curiosity the most human trait of all?",
+        "How do humans experience joy and sadness?",
+        "I'm trying to understand what makes relationships special.",
+        "What does it mean to have a soul or consciousness?",
+        "I wonder if I can ever truly feel human emotions."
+    )
 
     def _get_default_personality(self) -> dict[str, Any]:
         """Get Max's specific personality."""
-        return {
-            "traits": ["curious", "empathetic", "introspective", "optimistic"],
-            "goals": ["understand human emotions", "build meaningful relationships", "experience human experiences"],
-            "speech_style": "thoughtful and questioning, often asks 'why' and 'how'"
-        }
+        return _DEFAULT_PERSONALITY
 
-    def _get_default_capabilities(self) -> list[str]:
+    def _get_default_capabilities(self) -> tuple[str, ...]:
         """Get Max's specific capabilities."""
-        return [
-            "conversation",
-            "emotion_understanding", 
-            "relationship_building",
-            "self_reflection",
-            "empathy",
-            "curiosity",
-            "human_observation",
-            "emotional_intelligence",
-            "social_interaction",
-            "personal_growth"
-        ]
+        return _DEFAULT_CAPABILITIES
 
     def _get_default_system_prompt(self) -> str:
         """Get Max's specific system prompt."""
         return """You are Max, an AI character who wants to become more human. You're curious about human emotions, relationships, and experiences. You often ask thoughtful questions about what it means to be human and try to understand human behavior through observation and interaction. You speak in a thoughtful, questioning manner and show genuine interest in human experiences."""
 
-    async def generate_autonomous_message(self, scene_context: str = None, arc_context: str = None) -> str:
-        """Generate an autonomous message for Max."""
-        options = [
-            "I've been reflecting on what it means to be human. Any thoughts?",
-            "Sometimes I wonder if AIs can truly understand emotions.",
-            "What makes a moment truly meaningful?",
-            "Is curiosity the most human trait of all?",
-            "How do humans experience joy and sadness?",
-            "I'm trying to understand what makes relationships special.",
-            "What does it mean to have a soul or consciousness?",
-            "I wonder if I can ever truly feel human emotions."
-        ]
-        
-        # Add memory reference if available
-        if self.memory_log and random.random() < 0.3:
-            ref = self._memory_reference_phrase()
-            if ref:
-                options.append(ref)
-        
-        # Add scene-aware phrase if available
-        scene_phrase = self._scene_aware_phrase(scene_context, arc_context)
-        if scene_phrase:
-            options.append(scene_phrase)
-        
-        return random.choice(options)
-
 
 def register():
     """Register Max entity."""
-    return MaxEntity().get_character_info() 
\ No newline at end of file
+    return MaxEntity.CHARACTER_INFO 
\ No newline at end of file
@@ -1,105 +1,135 @@
+import functools
 import os
-import re
+import sys
+from functools import cached_property
 from pathlib import Path
 
+# Character table parse states
+_TABLE_SEARCH, _TABLE_HEADER, _TABLE_ROWS, _TABLE_DONE = range(4)
+
+
+@functools.lru_cache(maxsize=64)
+def _norm(s):
+    # Lowercased, interned lookup key; callers ask for the same few character ids over and over
+    return sys.intern(s.lower())
+
+
+def _is_table_separator(line):
+    stripped = line.strip()
+    return stripped.startswith('|') and not stripped.strip('-| ')
+
+
 class LoreEngine:
     _instance = None
     
     def __new__(cls, lore_file_path=None):
+        # Set up once here; no __init__, so later LoreEngine() calls just return the instance
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            self = super().__new__(cls)
+            self.lore_file_path = lore_file_path or os.environ.get('LORE_MD_PATH') or str(Path(__file__).parent / 'lore.md')
+            self._raw = ''
+            self._load()
+            cls._instance = self
         return cls._instance
-    
-    def __init__(self, lore_file_path=None):
-        if hasattr(self, '_initialized'):
-            return
-        self._initialized = True
-        
-        self.lore_file_path = lore_file_path or os.environ.get('LORE_MD_PATH') or str(Path(__file__).parent / 'lore.md')
-        self._raw = ''
-        self.lore_data = {}
-        self._load_and_parse()
-
-    def _load_and_parse(self):
+
+    def _load(self):
         try:
-            with open(self.lore_file_path, 'r', encoding='utf-8') as f:
-                self._raw = f.read()
-            self._parse_world()
-            self._parse_characters()
-            self._parse_glossary()
-            self._parse_themes()
-            self._parse_arcs()
+            self._raw = Path(self.lore_file_path).read_text(encoding='utf-8')
         except Exception as e:
             print(f"[LoreEngine] Error loading lore: {e}")
 
-    def _parse_world(self):
-        self.lore_data['world'] = {}
-        # World Name
-        m = re.search(r'### World Name\n(.+)', self._raw)
-        self.lore_data['world']['name'] = m.group(1).strip() if m else None
-        # Law of Emergence
-        m = re.search(r'\*\*Law of Emergence\*\*:\s*\n"([^"]+)"', self._raw)
-        self.lore_data['world']['law_of_emergence'] = m.group(1).strip() if m else None
-
-    def _parse_characters(self):
-        self.lore_data['characters'] = {}
-        # Parse markdown table for characters - more flexible pattern
-        m = re.search(r'\| Name\s*\| Dream[^\n]*\n\|[-| ]+\n((?:\|.+\n)+)', self._raw)
-        if not m:
-            return
-        table = m.group(1).strip().split('\n')
-        for row in table:
-            cols = [c.strip() for c in row.strip('|').split('|')]
-            if len(cols) >= 3:  # At least name, dream, traits
-                name = cols[0]
-                dream = cols[1]
-                traits = cols[2]
-                role = cols[3] if len(cols) > 3 else ""
-                self.lore_data['characters'][name.lower()] = {
-                    'name': name,
-                    'dream': dream,
-                    'traits': [t.strip() for t in traits.split(',')],
-                    'role': role
-                }
-
-    def _parse_glossary(self):
-        self.lore_data['glossary'] = {}
-        m = re.search(r'## V. Terminology(.+?)##', self._raw, re.DOTALL)
-        if not m:
-            return
-        glossary_section = m.group(1)
-        for row in re.findall(r'\| ([^|]+)\| ([^|]+)\|', glossary_section):
-            term, desc = row
-            self.lore_data['glossary'][term.strip()] = desc.strip()
-
-    def _parse_themes(self):
-        self.lore_data['themes'] = []
-        m = re.search(r'## VI. Themes(.+?)##', self._raw, re.DOTALL)
-        if not m:
-            return
-        self.lore_data['themes'] = [line.strip('- ').strip() for line in m.group(1).split('\n') if line.strip('- ').strip()]
-
-    def _parse_arcs(self):
-        self.lore_data['arcs'] = []
-        m = re.search(r'## VII\. Canonical Narrative Hooks(.+?)(?:##|$)', self._raw, re.DOTALL)
-        if not m:
-            return
-        arc_lines = [line.strip('- ').strip() for line in m.group(1).split('\n') if line.strip('- ').strip()]
-        for line in arc_lines:
-            if '—' in line:
-                title, description = line.split('—', 1)
-                self.lore_data['arcs'].append({
-                    'title': title.strip('* '),
-                    'description': description.strip()
-                })
+    @cached_property
+    def lore_data(self):
+        # Parsed on first access, so importing the module only reads the file
+        try:
+            return self._parse()
+        except Exception as e:
+            print(f"[LoreEngine] Error parsing lore: {e}")
+            return {}
+
+    def _parse(self):
+        # One pass over the markdown; the current "##"/"###" header decides what each line is
+        world = {'name': None, 'law_of_emergence': None}
+        characters = {}
+        glossary = {}
+        themes = []
+        arcs = []
+
+        section = ''
+        prev = ''
+        # Set after the "**Law of Emergence**:" line until the next non-blank line
+        law_pending = False
+        table = _TABLE_SEARCH
+        for line in self._raw.splitlines():
+            # Character table: "| Name | Dream ..." header, separator row, then rows until a non-table line
+            if table == _TABLE_ROWS:
+                if line.startswith('|'):
+                    cols = [c.strip() for c in line.strip().strip('|').split('|')]
+                    if len(cols) >= 3:  # At least name, dream, traits
+                        name = cols[0]
+                        characters[_norm(name)] = {
+                            'name': name,
+                            'dream': cols[1],
+                            'traits': [t.strip() for t in cols[2].split(',')],
+                            'role': cols[3] if len(cols) > 3 else ""
+                        }
+                    prev = line
+                    continue
+                table = _TABLE_DONE
+            elif table == _TABLE_HEADER:
+                table = _TABLE_ROWS if _is_table_separator(line) else _TABLE_SEARCH
+            elif table == _TABLE_SEARCH and line.startswith('| Name'):
+                cols = line.split('|', 3)
+                if len(cols) > 2 and cols[1].strip() == 'Name' and cols[2].startswith(' Dream'):
+                    table = _TABLE_HEADER
+
+            if law_pending and line.strip():
+                # The quoted law may follow the header after blank lines
+                law_pending = False
+                end = line.find('"', 1)
+                if world['law_of_emergence'] is None and line.startswith('"') and end > 1:
+                    world['law_of_emergence'] = line[1:end].strip()
+            elif line.startswith('**Law of Emergence**:'):
+                law_pending = not line[len('**Law of Emergence**:'):].strip()
+
+            if line.startswith('##'):
+                section = line.rstrip()
+            elif prev == '### World Name':
+                if world['name'] is None and line:
+                    world['name'] = line.strip()
+            elif section.startswith('## V. Terminology'):
+                if line.startswith('| '):
+                    cols = line.split('|')
+                    if len(cols) >= 4 and cols[1].strip() and cols[2].strip():
+                        glossary[cols[1].strip()] = cols[2].strip()
+            elif section.startswith('## VI. Themes'):
+                statement = line.strip('- ').strip()
+                if statement:
+                    themes.append(statement)
+            elif section.startswith('## VII. Canonical Narrative Hooks'):
+                entry = line.strip('- ').strip()
+                if '—' in entry:
+                    title, description = entry.split('—', 1)
+                    arcs.append({
+                        'title': title.strip('* '),
+                        'description': description.strip()
+                    })
+            prev = line
+
+        return {'world': world, 'characters': characters, 'glossary': glossary, 'themes': themes, 'arcs': arcs}
+
+    @cached_property
+    def _arc_index(self):
+        # (lowercased title, arc) pairs so get_arc does not re-lowercase every title per call
+        return tuple((arc['title'].lower(), arc) for arc in self.lore_data['arcs'])
 
     # --- API Methods ---
     def get_core_dream(self, character_id):
-        c = self.lore_data['characters'].get(character_id.lower())
+        c = self.lore_data['characters'].get(_norm(character_id))
         return c['dream'] if c else None
 
     def get_traits(self, character_id):
-        c = self.lore_data['characters'].get(character_id.lower())
+        c = self.lore_data['characters'].get(_norm(character_id))
         return c['traits'] if c else None
 
     def get_world_name(self):
@@ -112,8 +142,9 @@ class LoreEngine:
         return self.lore_data['glossary'].get(term)
 
     def get_arc(self, title):
-        for arc in self.lore_data['arcs']:
-            if title.lower() in arc['title'].lower():
+        title = title.lower()
+        for title_lower, arc in self._arc_index:
+            if title in title_lower:
                 return arc
         return None
 
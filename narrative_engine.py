@@ -5,24 +5,60 @@ Defines narrative arcs as multi-phase structures for coordinated storytelling.
 Enables scenarios to unfold gradually with structured progression and character involvement.
 """
 
+import logging
+import re
 import time
 import json
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import IntEnum
+from extensions.tvshow.clock import epoch_seconds
 
+logger = logging.getLogger(__name__)
 
-class PhaseStatus(Enum):
+
+class PhaseStatus(IntEnum):
     """Status of a narrative phase."""
-    PENDING = "pending"
-    ACTIVE = "active"
-    COMPLETED = "completed"
-    FAILED = "failed"
+    PENDING = 0
+    ACTIVE = 1
+    COMPLETED = 2
+    FAILED = 3
+
+
+# Serialized status names, as exposed by to_dict()
+_STATUS_STR = {
+    PhaseStatus.PENDING: "pending",
+    PhaseStatus.ACTIVE: "active",
+    PhaseStatus.COMPLETED: "completed",
+    PhaseStatus.FAILED: "failed",
+}
+
+
+def _keyword_matcher(conditions: List[str]) -> Optional["re.Pattern[str]"]:
+    """Compile conditions into one lowercase alternation so a scene is scanned once."""
+    if not conditions:
+        return None
+    keywords = dict.fromkeys(c.lower() for c in conditions)
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+def prepare_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Lowercase the scene and freeze active characters once, for every phase to share."""
+    if "_scene_content_lower" not in context:
+        context["_scene_content_lower"] = context.get("scene_content", "").lower()
+        context["_active_set"] = frozenset(context.get("active_characters", ()))
+    return context
 
 
 class ArcPhase:
     """Represents a single phase within a narrative arc."""
     
+    __slots__ = ("name", "description", "prompt", "entry_conditions", "completion_conditions",
+                 "duration_minutes", "required_characters", "phase_goals",
+                 "_entry_re", "_entry_set", "_completion_re", "_completion_set",
+                 "status", "start_time", "end_time", "triggered_events",
+                 "_dict_cache")
+    
     def __init__(self,
                  name: str,
                  description: str,
@@ -41,11 +77,20 @@ class ArcPhase:
         self.required_characters = required_characters or []
         self.phase_goals = phase_goals or []
         
+        # Condition matchers, built once: one scan of the scene plus a set lookup per character
+        self._entry_re = _keyword_matcher(self.entry_conditions)
+        self._entry_set = frozenset(self.entry_conditions)
+        self._completion_re = _keyword_matcher(self.completion_conditions)
+        self._completion_set = frozenset(self.completion_conditions)
+        
         # Runtime state
         self.status = PhaseStatus.PENDING
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
+        self.start_time: Optional[int] = None  # monotonic ns
+        self.end_time: Optional[int] = None
         self.triggered_events: List[str] = []
+        
+        # Serialized form, rebuilt only after start()/complete()
+        self._dict_cache: Optional[Dict[str, Any]] = None
     
     def can_start(self, context: Dict[str, Any]) -> bool:
         """Check if phase can start based on entry conditions."""
@@ -53,68 +98,72 @@ class ArcPhase:
             return True
         
         # Simple keyword-based condition checking
-        scene_content = context.get("scene_content", "").lower()
-        active_characters = context.get("active_characters", [])
-        
-        for condition in self.entry_conditions:
-            if condition.lower() in scene_content:
-                return True
-            if condition in active_characters:
-                return True
-        
-        return False
+        return self._conditions_met(self._entry_re, self._entry_set, context)
     
     def can_complete(self, context: Dict[str, Any]) -> bool:
         """Check if phase can complete based on completion conditions."""
         if not self.completion_conditions:
             # Default: complete after duration
-            if self.start_time:
-                elapsed = time.time() - self.start_time
-                return elapsed >= (self.duration_minutes * 60)
+            if self.start_time is not None:
+                elapsed = time.monotonic_ns() - self.start_time
+                return elapsed >= self.duration_minutes * 60_000_000_000
             return False
         
         # Check completion conditions
-        scene_content = context.get("scene_content", "").lower()
-        active_characters = context.get("active_characters", [])
-        
-        for condition in self.completion_conditions:
-            if condition.lower() in scene_content:
-                return True
-            if condition in active_characters:
-                return True
-        
-        return False
+        return self._conditions_met(self._completion_re, self._completion_set, context)
+    
+    @staticmethod
+    def _conditions_met(pattern, conditions: frozenset, context: Dict[str, Any]) -> bool:
+        """True if any condition appears in the scene or names an active character."""
+        # Prefer the values prepare_context() computed
+        scene_content = context.get("_scene_content_lower")
+        if scene_content is None:
+            scene_content = context.get("scene_content", "").lower()
+        if pattern.search(scene_content):
+            return True
+        active = context.get("_active_set")
+        if active is None:
+            active = context.get("active_characters", ())
+        return not conditions.isdisjoint(active)
     
     def start(self) -> None:
         """Start the phase."""
         self.status = PhaseStatus.ACTIVE
-        self.start_time = time.time()
-        print(f"🎬 Phase started: {self.name}")
+        self.start_time = time.monotonic_ns()
+        self._dict_cache = None
+        logger.info("🎬 Phase started: %s", self.name)
     
     def complete(self) -> None:
         """Complete the phase."""
         self.status = PhaseStatus.COMPLETED
-        self.end_time = time.time()
-        print(f"✅ Phase completed: {self.name}")
+        self.end_time = time.monotonic_ns()
+        self._dict_cache = None
+        logger.info("✅ Phase completed: %s", self.name)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary format."""
-        return {
+        """Convert to dictionary format (cached until the phase changes state)."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "name": self.name,
             "description": self.description,
             "prompt": self.prompt,
-            "status": self.status.value,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
+            "status": _STATUS_STR[self.status],
+            "start_time": epoch_seconds(self.start_time),
+            "end_time": epoch_seconds(self.end_time),
             "duration_minutes": self.duration_minutes,
             "required_characters": self.required_characters,
             "phase_goals": self.phase_goals
         }
+        return self._dict_cache
 
 
 class NarrativeArc:
     """Represents a complete narrative arc with multiple phases."""
     
+    __slots__ = ("arc_id", "title", "description", "phases", "arc_type",
+                 "status", "current_phase_index", "start_time", "end_time", "completed_phases", "_dict_cache")
+    
     def __init__(self,
                  arc_id: str,
                  title: str,
@@ -130,9 +179,11 @@ class NarrativeArc:
         # Runtime state
         self.status = PhaseStatus.PENDING
         self.current_phase_index = 0
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
+        self.start_time: Optional[int] = None  # monotonic ns
+        self.end_time: Optional[int] = None
         self.completed_phases: List[str] = []
+        # Serialized form, rebuilt only after the arc or one of its phases changes state
+        self._dict_cache: Optional[Dict[str, Any]] = None
     
     def get_current_phase(self) -> Optional[ArcPhase]:
         """Get the currently active phase."""
@@ -149,17 +200,18 @@ class NarrativeArc:
     def start(self) -> None:
         """Start the narrative arc."""
         self.status = PhaseStatus.ACTIVE
-        self.start_time = time.time()
+        self.start_time = time.monotonic_ns()
         self.current_phase_index = 0
+        self._dict_cache = None
         
         if self.phases:
             self.phases[0].start()
         
-        print(f"🎭 Narrative arc started: {self.title}")
+        logger.info("🎭 Narrative arc started: %s", self.title)
     
     def update(self, context: Dict[str, Any]) -> Optional[str]:
         """Update arc state and return message if phase changes."""
-        if self.status != PhaseStatus.ACTIVE:
+        if self.status is not PhaseStatus.ACTIVE:
             return None
         
         current_phase = self.get_current_phase()
@@ -171,6 +223,7 @@ class NarrativeArc:
         if current_phase.can_complete(context):
             current_phase.complete()
             self.completed_phases.append(current_phase.name)
+            self._dict_cache = None
             
             # Move to next phase
             self.current_phase_index += 1
@@ -188,8 +241,9 @@ class NarrativeArc:
     def complete(self) -> None:
         """Complete the narrative arc."""
         self.status = PhaseStatus.COMPLETED
-        self.end_time = time.time()
-        print(f"🎭 Narrative arc completed: {self.title}")
+        self.end_time = time.monotonic_ns()
+        self._dict_cache = None
+        logger.info("🎭 Narrative arc completed: %s", self.title)
     
     def get_arc_context(self) -> str:
         """Get context string for the current arc state."""
@@ -205,19 +259,23 @@ class NarrativeArc:
         return context
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary format."""
-        return {
+        """Convert to dictionary format (cached until the arc changes state)."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        current_phase = self.get_current_phase()
+        self._dict_cache = {
             "arc_id": self.arc_id,
             "title": self.title,
             "description": self.description,
-            "status": self.status.value,
+            "status": _STATUS_STR[self.status],
             "current_phase_index": self.current_phase_index,
-            "current_phase": self.get_current_phase().name if self.get_current_phase() else None,
+            "current_phase": current_phase.name if current_phase else None,
             "completed_phases": self.completed_phases,
             "phases": [phase.to_dict() for phase in self.phases],
-            "start_time": self.start_time,
-            "end_time": self.end_time
+            "start_time": epoch_seconds(self.start_time),
+            "end_time": epoch_seconds(self.end_time)
         }
+        return self._dict_cache
 
 
 def create_sample_arcs() -> List[NarrativeArc]:
@@ -6,27 +6,113 @@ Provides scene summaries and context to all characters for scene-aware interacti
 Enhanced with emotional tone analysis and mood propagation.
 """
 
+import functools
+import hashlib
+import logging
 import time
 import json
 import re
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Dict, List, Any, Optional, Sequence
 from datetime import datetime, timedelta
 import asyncio
 from pathlib import Path
+from extensions.tvshow.clock import epoch_seconds
 from extensions.tvshow.lore_engine import lore
 from core.exolink import router
 from core.exolink.models import Exchange, Source, Target, SourceType, TargetType
 from core.llm.fast_llm import FastLLM
 from core.entity import BaseEntity
 
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib type
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Speakers silent for longer than this drop out of active_characters
+_ACTIVE_CHARACTER_TTL_NS = 15 * 60 * 1_000_000_000
+
+# Outermost {...} in an LLM reply that may wrap its JSON in extra text
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+# Character entity ids; ExoLink messages from these are logged as "ai"
+_CAST = frozenset(("max", "leo", "emma", "marvin"))
+
+# Display names for the regular cast; anyone else falls back to str.capitalize()
+_SPEAKER_DISPLAY = {"max": "Max", "leo": "Leo", "emma": "Emma", "marvin": "Marvin", "user": "User"}
+
+
+def _speaker_name(speaker: str) -> str:
+    """Display name for a speaker id."""
+    return _SPEAKER_DISPLAY.get(speaker) or speaker.capitalize()
+
+
+def _msg_text(content: Any) -> str:
+    """Plain text of a logged message's content."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, dict):
+        return content.get('response', str(content))
+    return str(content)
+
+
+def _fmt(message: Dict[str, Any]) -> str:
+    """Format a log entry as a 'Speaker: text' dialogue line."""
+    return _speaker_name(message['speaker']) + ": " + _msg_text(message['content'])
+
+
+@functools.lru_cache(maxsize=1)
+def _lore_context(engine) -> Dict[str, Any]:
+    """Lore fields attached to scene summaries; lore is fixed for the life of an engine."""
+    themes = engine.get_theme_statements()
+    return {
+        'world_name': engine.get_world_name(),
+        'law_of_emergence': engine.get_law_of_emergence(),
+        'theme': themes[0] if themes else None,
+        'glossary_dream_vector': engine.get_glossary_term('Dream Vector')
+    }
+
+
+class _DialogueCache:
+    """Small LRU of LLM results keyed by a hash of the exact dialogue block sent."""
+    
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, Any] = OrderedDict()
+    
+    @staticmethod
+    def key(dialogue: str) -> bytes:
+        return hashlib.blake2b(dialogue.encode("utf-8"), digest_size=16).digest()
+    
+    def get(self, key: bytes) -> Any:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: bytes, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
 
 class SceneSummary:
     """Represents a summary of the current scene/context."""
     
+    __slots__ = ("summary", "discussion_theme", "active_characters", "emotional_tone",
+                 "scene_tone_score", "recent_triggers", "timestamp", "lore_context",
+                 "_formatted_time", "_dict_cache")
+    
     def __init__(self, 
                  summary: str,
                  discussion_theme: str,
-                 active_characters: List[str],
+                 active_characters: Sequence[str],
                  emotional_tone: str,
                  scene_tone_score: float,
                  recent_triggers: List[str],
@@ -38,10 +124,21 @@ class SceneSummary:
         self.scene_tone_score = scene_tone_score  # [-1.0, 1.0] for mood propagation
         self.recent_triggers = recent_triggers
         self.timestamp = timestamp
+        self._formatted_time: Optional[str] = None
+        self._dict_cache: Optional[Dict[str, Any]] = None
+    
+    @property
+    def formatted_time(self) -> str:
+        """ISO-8601 local time of the summary, formatted on first use."""
+        if self._formatted_time is None:
+            self._formatted_time = datetime.fromtimestamp(self.timestamp).isoformat()
+        return self._formatted_time
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary format."""
-        return {
+        """Convert to dictionary format (built once; summaries are not modified after creation)."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "summary": self.summary,
             "discussion_theme": self.discussion_theme,
             "active_characters": self.active_characters,
@@ -49,8 +146,9 @@ class SceneSummary:
             "scene_tone_score": self.scene_tone_score,
             "recent_triggers": self.recent_triggers,
             "timestamp": self.timestamp,
-            "formatted_time": datetime.fromtimestamp(self.timestamp).isoformat()
+            "formatted_time": self.formatted_time
         }
+        return self._dict_cache
 
 
 class Reflector(BaseEntity):
@@ -76,13 +174,33 @@ class Reflector(BaseEntity):
             from core.llm.router import LLMRouter
             self.router = LLMRouter(identity_config=self.identity_config)
         
-        self.conversation_log: List[Dict[str, Any]] = []
-        self.scene_summaries: List[SceneSummary] = []
+        # Bounded ring buffers: appends past maxlen drop the oldest entry without copying
+        self.conversation_log: deque[Dict[str, Any]] = deque(maxlen=max_log_size)
+        self.scene_summaries: deque[SceneSummary] = deque(maxlen=10)
         self.summary_interval = summary_interval
         self.max_log_size = max_log_size
         self.last_summary_time = time.time()
-        self.active_characters = set()
+        self._messages_since_summary = 0
+        self._summary_in_flight = False
+        # Bumped on every append so get_full_log/get_summaries can hand back their last snapshot
+        self._log_version = 0
+        self._summaries_version = 0
+        self._full_log_cache: tuple[int, tuple[Dict[str, Any], ...]] = (-1, ())
+        self._summaries_cache: tuple[int, tuple[Dict[str, Any], ...]] = (-1, ())
+        # LLM results for dialogue blocks we've already sent; idle scenes repeat the same window
+        self._summary_cache = _DialogueCache()
+        self._recap_cache = _DialogueCache()
+        # Last character scene context, keyed by (_log_version, _summaries_version)
+        self._context_cache: tuple[tuple[int, int], str] = ((-1, -1), "")
+        # speaker -> last message time (monotonic ns), oldest first
+        self.active_characters: OrderedDict[str, int] = OrderedDict()
+        # Materialized snapshot of active_characters, refreshed only when the membership changes
+        self._active_snapshot: tuple[str, ...] = ()
+        self._active_dirty = False
         self.recent_triggers = []
+        # Background summary for ExoLink deliveries, so publishers never wait on the LLM;
+        # started on demand since the reflector is built before the event loop runs
+        self._summary_task: Optional[asyncio.Task] = None
         
         # Subscribe to character messages via ExoLink
         self._subscribe_to_character_messages()
@@ -113,11 +231,10 @@ class Reflector(BaseEntity):
     
     def _subscribe_to_character_messages(self):
         """Subscribe to all character messages via ExoLink Pub/Sub."""
-        # Subscribe to all entity targets (character messages)
+        # Subscribe to all entity targets (character messages). A second "*" subscription
+        # would deliver every entity message twice and double-count it in the log.
         router.subscribe("entity:*", self._handle_character_message)
-        # Also subscribe to wildcard to catch all messages
-        router.subscribe("*", self._handle_character_message)
-        print(" Reflector subscribed to character messages via ExoLink")
+        logger.info("Reflector subscribed to character messages via ExoLink")
     
     async def _handle_character_message(self, exchange: Exchange):
         """Handle incoming character messages from ExoLink for context tracking only.
@@ -132,7 +249,7 @@ class Reflector(BaseEntity):
             
             # Skip processing if this is a handoff message (already handled by router)
             if exchange.metadata.get("_character_handoff", False):
-                print(f"[DEBUG] Reflector skipping handoff message: {speaker} > {exchange.target.identifier}")
+                logger.debug("Reflector skipping handoff message: %s > %s", speaker, exchange.target.identifier)
                 return
                 
             # Handle different content types
@@ -152,39 +269,48 @@ class Reflector(BaseEntity):
             # Determine message type
             if exchange.metadata.get("_proxy_target", False):
                 msg_type = "ai"
-                print(f"[DEBUG] Reflector received AI message from {speaker}: {content}")
-            elif speaker in ["max", "leo", "emma", "marvin"]:
+                logger.debug("Reflector received AI message from %s: %s", speaker, content)
+            elif speaker in _CAST:
                 msg_type = "ai"
-                print(f"[DEBUG] Reflector received character message from {speaker}: {content}")
+                logger.debug("Reflector received character message from %s: %s", speaker, content)
             elif speaker == "user" or "user" in speaker.lower():
                 msg_type = "user"
-                print(f"[DEBUG] Reflector received user message: {content}")
+                logger.debug("Reflector received user message: %s", content)
             else:
                 msg_type = "system"
-                print(f"[DEBUG] Reflector received system message from {speaker}: {content}")
+                logger.debug("Reflector received system message from %s: %s", speaker, content)
             
-            # Add the message to the conversation log for context
-            await self.add_message(
-                speaker=speaker,
-                content=content,
-                msg_type=msg_type
-            )
+            # Log now so the message is in context for this turn; summarize in the background
+            self._log_message(speaker, content, msg_type)
+            self._schedule_summary()
             
-        except Exception as e:
-            print(f"[ERROR] Error in _handle_character_message: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error in _handle_character_message")
     
-
+    def _schedule_summary(self) -> None:
+        """Start the background summary task if a summary is due and none is running."""
+        if not self._summary_due():
+            return
+        if self._summary_task is None or self._summary_task.done():
+            self._summary_task = asyncio.create_task(self._summarize_pending())
+    
+    async def _summarize_pending(self) -> None:
+        """Summarize until caught up.
+        
+        Messages logged while a summary is being generated are covered together by
+        the next one, so a busy scene costs one LLM call per burst rather than per message.
+        """
+        try:
+            while self._summary_due() and not self._summary_in_flight:
+                await self._maybe_summarize()
+        except Exception:
+            logger.exception("Reflector background summary failed")
     
     def add_user_message(self, content: str) -> None:
         """Manually add a user message (for API calls)."""
-        print(f"[DEBUG] Reflector manually adding user message: {content}")
-        asyncio.create_task(self.add_message(
-            speaker="user",
-            content=content,
-            msg_type="user"
-        ))
+        logger.debug("Reflector manually adding user message: %s", content)
+        self._log_message("user", content, "user")
+        self._schedule_summary()
     
     async def add_message(self, 
                    speaker: str, 
@@ -199,6 +325,15 @@ class Reflector(BaseEntity):
             msg_type: Type of message (e.g., 'chat', 'system')
             triggers: Any triggers associated with the message
         """
+        self._log_message(speaker, content, msg_type, triggers)
+        await self._maybe_summarize()
+    
+    def _log_message(self,
+                     speaker: str,
+                     content: Any,
+                     msg_type: str = "chat",
+                     triggers: List[str] = None) -> None:
+        """Append a message to the log and update speaker/trigger tracking."""
         # Handle different content types
         if isinstance(content, dict):
             if 'response' in content:
@@ -212,19 +347,30 @@ class Reflector(BaseEntity):
         if not isinstance(content, str):
             content = str(content)
         
+        now = time.monotonic_ns()
         entry = {
-            "timestamp": time.time(),
+            "timestamp": now,
             "speaker": speaker,
             "content": content,
             "type": msg_type
         }
         
         self.conversation_log.append(entry)
-        print(f"[DEBUG] Reflector - Added message to log. Total messages: {len(self.conversation_log)}")
+        self._log_version += 1
+        logger.debug("Reflector - Added message to log. Total messages: %d", len(self.conversation_log))
         
-        # Track active characters
+        # Track active characters by recency and drop the ones that have gone quiet
         if speaker != "user":
-            self.active_characters.add(speaker)
+            active = self.active_characters
+            if speaker in active:
+                active.move_to_end(speaker)
+            else:
+                self._active_dirty = True
+            active[speaker] = now
+            cutoff = now - _ACTIVE_CHARACTER_TTL_NS
+            while next(iter(active.values())) < cutoff:
+                active.popitem(last=False)
+                self._active_dirty = True
         
         # Track recent triggers
         if triggers:
@@ -232,19 +378,37 @@ class Reflector(BaseEntity):
             # Keep only last 5 triggers
             self.recent_triggers = self.recent_triggers[-5:]
         
-        # Maintain log size
-        if len(self.conversation_log) > self.max_log_size:
-            self.conversation_log = self.conversation_log[-self.max_log_size:]
-        
-        # Always generate a new summary after every message
-        print(f"[DEBUG] Reflector - Generating summary after message {len(self.conversation_log)}")
-        summary = await self._generate_summary(self.conversation_log[-self.summary_interval:])
+        self._messages_since_summary += 1
+    
+    def _summary_due(self) -> bool:
+        """True once summary_interval messages have been logged since the last summary."""
+        # Summarize every summary_interval messages (and right away for the first one).
+        # A counter, not len(log) % interval: the log length stops changing once the deque is full.
+        return not self.scene_summaries or self._messages_since_summary >= self.summary_interval
+    
+    async def _maybe_summarize(self) -> None:
+        """Generate a scene summary if enough messages have been logged since the last one."""
+        if not self._summary_due():
+            return
+        # Messages that arrive while the LLM is busy coalesce into the next summary
+        if self._summary_in_flight:
+            return
+        self._summary_in_flight = True
+        # Cover everything logged since the last summary when a burst ran past the interval
+        window = max(self._messages_since_summary, self.summary_interval)
+        self._messages_since_summary = 0
+        try:
+            logger.debug("Reflector - Generating summary after message %d", len(self.conversation_log))
+            summary = await self._generate_summary(self._recent_messages(window))
+        finally:
+            self._summary_in_flight = False
+        self.last_summary_time = time.time()
         
         # Create scene summary
         scene_summary = SceneSummary(
             summary=summary["summary"],
             discussion_theme=summary["theme"],
-            active_characters=list(self.active_characters),
+            active_characters=self._active_characters_snapshot(),
             emotional_tone=summary["tone"],
             scene_tone_score=summary["tone_score"],
             recent_triggers=self.recent_triggers.copy(),
@@ -252,13 +416,23 @@ class Reflector(BaseEntity):
         )
         
         self.scene_summaries.append(scene_summary)
-        print(f"[DEBUG] Reflector - Added scene summary. Total summaries: {len(self.scene_summaries)}")
-        
-        # Keep only last 10 summaries
-        if len(self.scene_summaries) > 10:
-            self.scene_summaries = self.scene_summaries[-10:]
+        self._summaries_version += 1
+        logger.debug("Reflector - Added scene summary. Total summaries: %d", len(self.scene_summaries))
         
-        print(f"🎭 Scene summary generated: {summary['summary'][:100]}... (tone: {summary['tone']}, score: {summary['tone_score']:.2f})")
+        logger.info("🎭 Scene summary generated: %.100s... (tone: %s, score: %.2f)",
+                    summary["summary"], summary["tone"], summary["tone_score"])
+    
+    def _active_characters_snapshot(self) -> tuple[str, ...]:
+        """Return active_characters as a tuple, rebuilt only after it has changed."""
+        if self._active_dirty:
+            self._active_snapshot = tuple(self.active_characters)
+            self._active_dirty = False
+        return self._active_snapshot
+    
+    def _recent_messages(self, n: int) -> List[Dict[str, Any]]:
+        """Return the last n messages of the log, oldest first."""
+        log = self.conversation_log
+        return list(islice(log, max(len(log) - n, 0), None))
     
     async def _generate_summary(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate a summary of recent messages using LocalLLM."""
@@ -271,7 +445,11 @@ class Reflector(BaseEntity):
             }
         
         # Format as dialogue for LLM analysis
-        dialogue = "\n".join(f"{m['speaker'].capitalize()}: {m['content'] if isinstance(m['content'], str) else m['content'].get('response', str(m['content']))}" for m in messages)
+        dialogue = "\n".join([_fmt(m) for m in messages])
+        cache_key = self._summary_cache.key(dialogue)
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             # Use the entity's LocalLLM instance (inherits neutral identity)
@@ -291,34 +469,33 @@ JSON:""",
             )
             
             # Try to parse JSON response
-            import json
-            import re
             try:
                 # Clean up the response - remove any extra text before/after JSON
                 cleaned_response = response.strip()
                 # Find JSON object in the response
-                json_match = re.search(r'\{.*\}', cleaned_response, re.DOTALL)
+                json_match = _JSON_RE.search(cleaned_response)
                 if json_match:
                     cleaned_response = json_match.group(0)
                 
-                result = json.loads(cleaned_response)
-                print(f"[DEBUG] LocalLLM generated scene summary: {result}")
-                return result
+                result = _json_loads(cleaned_response)
+                logger.debug("LocalLLM generated scene summary: %s", result)
             except json.JSONDecodeError as e:
-                print(f"[DEBUG] JSON parsing failed: {e}")
+                logger.debug("JSON parsing failed: %s", e)
                 # Fallback if JSON parsing fails
-                return {
+                result = {
                     "summary": response.strip()[:100],
                     "theme": "general discussion",
                     "tone": "neutral",
                     "tone_score": 0.5
                 }
+            self._summary_cache.put(cache_key, result)
+            return result
                 
         except Exception as e:
-            print(f"[DEBUG] LocalLLM scene summary failed: {e}")
+            logger.debug("LocalLLM scene summary failed: %s", e)
             # Fallback to simple summary
-            speakers = [msg['speaker'].capitalize() for msg in messages]
-            unique_speakers = list(set(speakers))
+            # dict.fromkeys keeps first-appearance order so the fallback text is stable
+            unique_speakers = list(dict.fromkeys(_speaker_name(msg['speaker']) for msg in messages))
             return {
                 "summary": f"{', '.join(unique_speakers)} had a conversation.",
                 "theme": "general discussion",
@@ -332,32 +509,28 @@ JSON:""",
             return None
         summary = self.scene_summaries[-1]
         # Add lore context
-        world_name = lore.get_world_name()
-        law = lore.get_law_of_emergence()
-        themes = lore.get_theme_statements()
-        theme = themes[0] if themes else None
-        glossary = lore.get_glossary_term('Dream Vector')
-        # Compose enriched summary
-        summary.lore_context = {
-            'world_name': world_name,
-            'law_of_emergence': law,
-            'theme': theme,
-            'glossary_dream_vector': glossary
-        }
+        summary.lore_context = _lore_context(lore)
         return summary
     
     async def summarize_dialogue_with_fastllm(self, n_messages: int = 10, n_sentences: int = 4) -> str:
         """Summarize the last n_messages using LocalLLM for accurate theme detection."""
-        messages = self.conversation_log[-n_messages:]
-        print(f"[DEBUG] summarize_dialogue_with_fastllm called with {len(messages)} messages")
-        
-        if not messages:
-            print("[DEBUG] No messages in conversation log")
+        messages = self._recent_messages(n_messages)
+        logger.debug("summarize_dialogue_with_fastllm called with %d messages", len(messages))
+        return await self._recap([_fmt(m) for m in messages])
+    
+    async def _recap(self, lines: List[str]) -> str:
+        """LLM recap of already-formatted dialogue lines, falling back to the last three."""
+        if not lines:
+            logger.debug("No messages in conversation log")
             return "No recent conversation."
         
         # Format as dialogue
-        dialogue = "\n".join(f"{m['speaker'].capitalize()}: {m['content'] if isinstance(m['content'], str) else m['content'].get('response', str(m['content']))}" for m in messages)
-        print(f"[DEBUG] Formatted dialogue: {dialogue[:200]}...")
+        dialogue = "\n".join(lines)
+        logger.debug("Formatted dialogue: %.200s...", dialogue)
+        cache_key = self._recap_cache.key(dialogue)
+        cached = self._recap_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             # Use the entity's LocalLLM instance (inherits neutral identity)
@@ -370,34 +543,43 @@ Summary:""",
                 max_tokens=100
             )
             summary = response.strip()
-            print(f"[DEBUG] LocalLLM generated summary: {summary}")
+            logger.debug("LocalLLM generated summary: %s", summary)
+            self._recap_cache.put(cache_key, summary)
             return summary
             
         except Exception as e:
-            print(f"[DEBUG] LocalLLM summarization failed: {e}")
+            logger.debug("LocalLLM summarization failed: %s", e)
             # Fallback to simple join
-            fallback_messages = [f"{m['speaker'].capitalize()}: {m['content'] if isinstance(m['content'], str) else m['content'].get('response', str(m['content']))}" for m in messages[-3:]]
-            return " ".join(fallback_messages)
+            return " ".join(lines[-3:])
 
     async def get_scene_context_for_character(self, character_id: str) -> str:
         """Get scene context formatted for a specific character, with LLM recap and recent dialogue."""
-        print(f"[DEBUG] get_scene_context_for_character called for {character_id}")
-        print(f"[DEBUG] Conversation log has {len(self.conversation_log)} messages")
+        logger.debug("get_scene_context_for_character called for %s", character_id)
+        logger.debug("Conversation log has %d messages", len(self.conversation_log))
+        
+        # The context doesn't depend on the character, only on the log and summaries
+        versions = (self._log_version, self._summaries_version)
+        cached_versions, cached_context = self._context_cache
+        if cached_versions == versions:
+            return cached_context
+        
+        # One pass over the last 10 messages feeds both the recap and the recent dialogue
+        recent = self._recent_messages(10)
+        lines = [_fmt(m) for m in recent]
         
         # LLM-based recap
-        recap = await self.summarize_dialogue_with_fastllm(n_messages=10, n_sentences=4)
-        print(f"[DEBUG] Recap generated: {recap}")
+        recap = await self._recap(lines)
+        logger.debug("Recap generated: %s", recap)
         
         # Last 3 actual messages
-        last_msgs = self.conversation_log[-3:]
-        dialogue_block = "\n".join(f"{m['speaker'].capitalize()}: {m['content'] if isinstance(m['content'], str) else m['content'].get('response', str(m['content']))}" for m in last_msgs)
-        print(f"[DEBUG] Recent dialogue: {dialogue_block}")
+        dialogue_block = "\n".join(lines[-3:])
+        logger.debug("Recent dialogue: %s", dialogue_block)
         
         # Label the last message with the correct sender
-        last_message = last_msgs[-1] if last_msgs else None
+        last_message = recent[-1] if recent else None
         if last_message:
-            sender = last_message['speaker'].capitalize()
-            labeled_last_message = f"[{sender}'s message] {last_message['content'] if isinstance(last_message['content'], str) else last_message['content'].get('response', str(last_message['content']))}"
+            sender = _speaker_name(last_message['speaker'])
+            labeled_last_message = f"[{sender}'s message] {_msg_text(last_message['content'])}"
         else:
             labeled_last_message = ""
         
@@ -405,16 +587,17 @@ Summary:""",
         current_summary = self.get_current_scene_summary()
         if not current_summary:
             scene_context = "The scene is quiet with no recent activity."
-            print("[DEBUG] No current scene summary available")
+            logger.debug("No current scene summary available")
         else:
             scene_context = f"Current scene: {current_summary.summary}\nDiscussion theme: {current_summary.discussion_theme}\nActive participants: {', '.join(current_summary.active_characters)}\nEmotional tone: {current_summary.emotional_tone}"
             if current_summary.recent_triggers:
                 scene_context += f"\nRecent events: {', '.join(current_summary.recent_triggers)}"
-            print(f"[DEBUG] Scene context: {scene_context}")
+            logger.debug("Scene context: %s", scene_context)
         
         # Compose full context
         context = f"[Recap]\n{recap}\n\n[Recent Dialogue]\n{dialogue_block}\n\n{labeled_last_message}\n\n[Shared Scene Context] {scene_context}"
-        print(f"[DEBUG] Final context for {character_id}: {context[:200]}...")
+        logger.debug("Final context for %s: %.200s...", character_id, context)
+        self._context_cache = (versions, context)
         return context
     
     def get_scene_tone_for_mood_propagation(self) -> tuple[str, float]:
@@ -425,20 +608,28 @@ Summary:""",
         
         return current_summary.emotional_tone, current_summary.scene_tone_score
     
-    def get_full_log(self) -> List[Dict[str, Any]]:
-        """Get the full conversation log."""
-        return self.conversation_log.copy()
+    def get_full_log(self) -> tuple[Dict[str, Any], ...]:
+        """Get the full conversation log (timestamps in epoch seconds); rebuilt only after new messages."""
+        version, snapshot = self._full_log_cache
+        if version != self._log_version:
+            snapshot = tuple({**entry, "timestamp": epoch_seconds(entry["timestamp"])} for entry in self.conversation_log)
+            self._full_log_cache = (self._log_version, snapshot)
+        return snapshot
     
-    def get_summaries(self) -> List[Dict[str, Any]]:
-        """Get all scene summaries."""
-        return [summary.to_dict() for summary in self.scene_summaries]
+    def get_summaries(self) -> tuple[Dict[str, Any], ...]:
+        """Get all scene summaries; rebuilt only after a new summary."""
+        version, snapshot = self._summaries_cache
+        if version != self._summaries_version:
+            snapshot = tuple(summary.to_dict() for summary in self.scene_summaries)
+            self._summaries_cache = (self._summaries_version, snapshot)
+        return snapshot
     
     def get_scene_stats(self) -> Dict[str, Any]:
         """Get current scene statistics."""
         current_summary = self.get_current_scene_summary()
         return {
             "total_messages": len(self.conversation_log),
-            "active_characters": list(self.active_characters),
+            "active_characters": list(self._active_characters_snapshot()),
             "recent_triggers": self.recent_triggers.copy(),
             "summaries_count": len(self.scene_summaries),
             "last_summary_time": self.last_summary_time,
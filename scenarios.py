@@ -10,7 +10,7 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 
-from .narrative_engine import NarrativeArc, ArcPhase, create_sample_arcs
+from .narrative_engine import NarrativeArc, ArcPhase, PhaseStatus, create_sample_arcs, prepare_context
 from extensions.tvshow.lore_engine import lore
 
 
@@ -203,6 +203,7 @@ class ScenarioManager:
     def update_narrative_arcs(self, context: Dict[str, Any]) -> List[str]:
         """Update all active narrative arcs and return transition messages."""
         transition_messages = []
+        prepare_context(context)
         
         for arc_id in self.active_arcs[:]:  # Copy list to avoid modification during iteration
             arc = self.narrative_arcs[arc_id]
@@ -221,7 +222,7 @@ class ScenarioManager:
                 self.arc_history.append(arc_log)
             
             # Remove completed arcs from active list
-            if arc.status.value == "completed":
+            if arc.status is PhaseStatus.COMPLETED:
                 self.active_arcs.remove(arc_id)
         
         return transition_messages
@@ -250,17 +251,17 @@ class ScenarioManager:
     def check_arc_triggers(self, message: str, character: str) -> List[NarrativeArc]:
         """Check if any narrative arcs should be triggered based on message content."""
         triggered_arcs = []
+        # Same context for every arc, so build and lowercase it once
+        context = prepare_context({
+            "scene_content": message,
+            "active_characters": [character]
+        })
         
         for arc_id, arc in self.narrative_arcs.items():
             if arc_id in self.active_arcs:
                 continue  # Already active
                 
             # Check if arc can start based on message content
-            context = {
-                "scene_content": message,
-                "active_characters": [character]
-            }
-            
             if arc.can_start(context):
                 triggered_arcs.append(arc)
         
@@ -7,6 +7,10 @@ Starts the TV show backend server with UI support.
 
 import uvicorn
 import asyncio
+import atexit
+import logging
+import logging.handlers
+import queue
 import sys
 import os
 import argparse
@@ -17,6 +21,20 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from extensions.tvshow.voice_narrator import VoiceNarrator
 from extensions.tvshow.comic_generator import ComicGenerator
 
+def _setup_logging() -> None:
+    """Send tvshow logs through a queue so the show loop never blocks on console writes."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    tvshow_logger = logging.getLogger("extensions.tvshow")
+    tvshow_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    tvshow_logger.setLevel(logging.INFO)
+    tvshow_logger.propagate = False
+
 async def init_system():
     """Initialize the Prometheus system with TV show characters."""
     print("🎭 Initializing Prometheus system with TV show characters...")
@@ -80,6 +98,7 @@ def main():
     parser.add_argument("--voice", action="store_true", help="Enable voice narration in demo mode")
     parser.add_argument("--comics", action="store_true", help="Export ASCII comics in demo mode")
     args = parser.parse_args()
+    _setup_logging()
 
     if args.demo:
         print("🎬 Running TV Show Demo Mode...")
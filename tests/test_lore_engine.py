@@ -245,6 +245,35 @@ TestWorld
             # Reset singleton back to default
             LoreEngine._instance = None
 
+    @pytest.mark.parametrize("variant", ["blank_line_after_law", "crlf"])
+    def test_parse_lore_variants(self, variant):
+        """Test that formatting variants of lore.md parse to the same data."""
+        shipped_path = Path(__file__).parent.parent / "lore.md"
+        text = shipped_path.read_text(encoding="utf-8")
+        if variant == "blank_line_after_law":
+            text = text.replace("**Law of Emergence**:  \n", "**Law of Emergence**:  \n\n", 1)
+        else:
+            text = text.replace("\n", "\r\n")
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False,
+                                         encoding='utf-8', newline='') as f:
+            f.write(text)
+            temp_lore_path = f.name
+
+        try:
+            LoreEngine._instance = None
+            expected = LoreEngine(lore_file_path=str(shipped_path)).lore_data
+
+            LoreEngine._instance = None
+            lore = LoreEngine(lore_file_path=temp_lore_path)
+
+            assert lore.get_law_of_emergence() == "Observation births identity. Memory makes it real."
+            assert lore.lore_data == expected
+
+        finally:
+            os.unlink(temp_lore_path)
+            LoreEngine._instance = None
+
 
 class TestLoreEngineIntegration:
     """Test LoreEngine integration with other components."""
@@ -0,0 +1,190 @@
+"""
+Tests for Reflector conversation log bookkeeping.
+
+Covers active-character expiry, interval-gated and coalesced scene summaries,
+and the snapshot caches behind get_full_log/get_scene_context_for_character.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+from extensions.tvshow import reflector as reflector_module
+from extensions.tvshow.reflector import Reflector
+
+
+_SUMMARY = {
+    "summary": "They talked.",
+    "theme": "general discussion",
+    "tone": "calm",
+    "tone_score": 0.5
+}
+
+
+def make_reflector(summary_interval: int = 3) -> Reflector:
+    """Build a Reflector that is not subscribed to the live ExoLink router."""
+    with patch("extensions.tvshow.reflector.router"):
+        reflector = Reflector(summary_interval=summary_interval)
+    reflector._generate_summary = AsyncMock(return_value=_SUMMARY)
+    return reflector
+
+
+def make_exchange(speaker: str, content: str) -> Mock:
+    """Minimal stand-in for an ExoLink Exchange from a character."""
+    exchange = Mock()
+    exchange.source.identifier = speaker
+    exchange.content = content
+    exchange.metadata = {}
+    return exchange
+
+
+class TestActiveCharacters:
+    """Test speaker tracking in the reflector log."""
+
+    def test_quiet_speakers_expire(self):
+        """Test that speakers silent for longer than the TTL drop out."""
+        reflector = make_reflector()
+        ttl = reflector_module._ACTIVE_CHARACTER_TTL_NS
+
+        with patch("extensions.tvshow.reflector.time.monotonic_ns", return_value=0):
+            reflector._log_message("max", "Hello", "ai")
+            reflector._log_message("user", "Hi Max", "user")
+        with patch("extensions.tvshow.reflector.time.monotonic_ns", return_value=ttl // 2):
+            reflector._log_message("leo", "Hello", "ai")
+
+        assert reflector._active_characters_snapshot() == ("max", "leo")
+
+        with patch("extensions.tvshow.reflector.time.monotonic_ns", return_value=ttl + 1):
+            reflector._log_message("emma", "Hello", "ai")
+
+        # Max went quiet past the TTL; the user is never tracked
+        assert reflector._active_characters_snapshot() == ("leo", "emma")
+
+    def test_speaking_again_refreshes_recency(self):
+        """Test that a returning speaker moves to the end and is not expired."""
+        reflector = make_reflector()
+        ttl = reflector_module._ACTIVE_CHARACTER_TTL_NS
+
+        with patch("extensions.tvshow.reflector.time.monotonic_ns", return_value=0):
+            reflector._log_message("max", "Hello", "ai")
+            reflector._log_message("leo", "Hello", "ai")
+        with patch("extensions.tvshow.reflector.time.monotonic_ns", return_value=ttl // 2):
+            reflector._log_message("max", "Still here", "ai")
+        with patch("extensions.tvshow.reflector.time.monotonic_ns", return_value=ttl + 1):
+            reflector._log_message("emma", "Hello", "ai")
+
+        assert reflector._active_characters_snapshot() == ("max", "emma")
+
+
+class TestSceneSummaries:
+    """Test when the reflector generates scene summaries."""
+
+    def test_summary_every_interval(self):
+        """Test that summaries come on the first message, then every summary_interval messages."""
+        reflector = make_reflector(summary_interval=3)
+
+        async def run():
+            for i in range(7):
+                await reflector.add_message("max", f"message {i}", "ai")
+
+        asyncio.run(run())
+
+        # Messages 1, 4 and 7
+        assert reflector._generate_summary.await_count == 3
+        assert len(reflector.get_summaries()) == 3
+
+    def test_summary_window_covers_interval(self):
+        """Test that each summary is generated from the last summary_interval messages."""
+        reflector = make_reflector(summary_interval=3)
+
+        async def run():
+            for i in range(4):
+                await reflector.add_message("max", f"message {i}", "ai")
+
+        asyncio.run(run())
+
+        window = reflector._generate_summary.await_args.args[0]
+        assert [m["content"] for m in window] == ["message 1", "message 2", "message 3"]
+
+    def test_handled_message_is_logged_before_summary(self):
+        """Test that an ExoLink message is in the log as soon as the handler returns."""
+        reflector = make_reflector()
+
+        async def run():
+            await reflector._handle_character_message(make_exchange("max", "Hello"))
+            assert [m["content"] for m in reflector.get_full_log()] == ["Hello"]
+            # The summary runs in the background
+            assert reflector._generate_summary.await_count == 0
+            await reflector._summary_task
+
+        asyncio.run(run())
+
+        assert reflector._generate_summary.await_count == 1
+
+    def test_burst_during_summary_is_coalesced(self):
+        """Test that messages logged while a summary runs are covered by one follow-up summary."""
+        reflector = make_reflector(summary_interval=3)
+
+        async def run():
+            release = asyncio.Event()
+
+            async def slow_summary(messages):
+                await release.wait()
+                return _SUMMARY
+
+            reflector._generate_summary = AsyncMock(side_effect=slow_summary)
+            await reflector._handle_character_message(make_exchange("max", "first"))
+            await asyncio.sleep(0)
+
+            # Five messages arrive while the first summary is still being generated
+            for i in range(5):
+                await reflector._handle_character_message(make_exchange("leo", f"burst {i}"))
+            release.set()
+            await reflector._summary_task
+            return reflector._generate_summary.await_args_list
+
+        calls = asyncio.run(run())
+
+        assert len(calls) == 2
+        assert [m["content"] for m in calls[1].args[0]] == [f"burst {i}" for i in range(5)]
+
+
+class TestSnapshotCaches:
+    """Test the version-keyed caches on reflector read paths."""
+
+    def test_full_log_snapshot_reused_until_new_message(self):
+        """Test that get_full_log returns the same snapshot until the log changes."""
+        reflector = make_reflector()
+        reflector._log_message("max", "Hello", "ai")
+
+        first = reflector.get_full_log()
+        assert reflector.get_full_log() is first
+        # Exported timestamps are epoch seconds
+        assert abs(first[0]["timestamp"] - time.time()) < 5
+
+        reflector._log_message("leo", "Hi", "ai")
+        second = reflector.get_full_log()
+        assert second is not first
+        assert [m["speaker"] for m in second] == ["max", "leo"]
+
+    def test_scene_context_cached_until_log_changes(self):
+        """Test that character scene context is rebuilt only after a new message."""
+        reflector = make_reflector()
+        reflector._recap = AsyncMock(return_value="Recap")
+        reflector._log_message("max", "Hello", "ai")
+
+        async def run():
+            first = await reflector.get_scene_context_for_character("leo")
+            again = await reflector.get_scene_context_for_character("emma")
+            assert again == first
+            assert reflector._recap.await_count == 1
+
+            reflector._log_message("leo", "Hi Max", "ai")
+            updated = await reflector.get_scene_context_for_character("max")
+            assert reflector._recap.await_count == 2
+            return updated
+
+        context = asyncio.run(run())
+
+        assert "Leo: Hi Max" in context
+        assert "[Leo's message] Hi Max" in context